@@ -228,14 +228,15 @@ class InstructionDurations:
         else:
             key = (name, tuple(qubits))
 
-        if key in self.duration_by_name_qubits_params:
-            duration, unit = self.duration_by_name_qubits_params[key]
-        elif key in self.duration_by_name_qubits:
-            duration, unit = self.duration_by_name_qubits[key]
-        elif name in self.duration_by_name:
-            duration, unit = self.duration_by_name[name]
-        else:
+        # Each table is probed with a single hash lookup, in order of priority
+        duration_unit = (
+            self.duration_by_name_qubits_params.get(key)
+            or self.duration_by_name_qubits.get(key)
+            or self.duration_by_name.get(name)
+        )
+        if duration_unit is None:
             raise TranspilerError(f"No value is found for key={key}")
+        duration, unit = duration_unit
 
         return self._convert_unit(duration, unit, to_unit)
 
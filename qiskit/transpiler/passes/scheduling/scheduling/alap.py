@@ -43,11 +43,13 @@ class ALAPScheduleAnalysis(BaseScheduler):
         conditional_latency = self.property_set.get("conditional_latency", 0)
         clbit_write_latency = self.property_set.get("clbit_write_latency", 0)
 
+        topo_nodes = list(dag.topological_op_nodes())
+        node_durations = self._precompute_durations(dag, topo_nodes)
+
         node_start_time = dict()
         idle_before = {q: 0 for q in dag.qubits + dag.clbits}
-        bit_indices = {bit: index for index, bit in enumerate(dag.qubits)}
-        for node in reversed(list(dag.topological_op_nodes())):
-            op_duration = self._get_node_duration(node, bit_indices, dag)
+        for node in reversed(topo_nodes):
+            op_duration = node_durations[node]
 
             # compute t0, t1: instruction interval, note that
             # t0: start time of instruction
@@ -122,6 +124,7 @@ class ALAPScheduleAnalysis(BaseScheduler):
 
         # Note that ALAP pass is inversely schedule, thus
         # t0 is computed by subtracting entire circuit duration from t1.
-        self.property_set["node_start_time"] = {
-            n: circuit_duration - t1 for n, t1 in node_start_time.items()
-        }
+        # Values are updated in place to avoid holding a second mapping of the same size.
+        for node, t1 in node_start_time.items():
+            node_start_time[node] = circuit_duration - t1
+        self.property_set["node_start_time"] = node_start_time
@@ -43,11 +43,13 @@ class ASAPScheduleAnalysis(BaseScheduler):
         conditional_latency = self.property_set.get("conditional_latency", 0)
         clbit_write_latency = self.property_set.get("clbit_write_latency", 0)
 
+        topo_nodes = list(dag.topological_op_nodes())
+        node_durations = self._precompute_durations(dag, topo_nodes)
+
         node_start_time = dict()
         idle_after = {q: 0 for q in dag.qubits + dag.clbits}
-        bit_indices = {q: index for index, q in enumerate(dag.qubits)}
-        for node in dag.topological_op_nodes():
-            op_duration = self._get_node_duration(node, bit_indices, dag)
+        for node in topo_nodes:
+            op_duration = node_durations[node]
 
             # compute t0, t1: instruction interval, note that
             # t0: start time of instruction
@@ -14,7 +14,7 @@
 
 import warnings
 
-from typing import Dict
+from typing import Dict, Iterable, List, Optional
 from qiskit.transpiler import InstructionDurations
 from qiskit.transpiler.basepasses import AnalysisPass
 from qiskit.transpiler.passes.scheduling.time_unit_conversion import TimeUnitConversion
@@ -207,55 +207,128 @@ class BaseScheduler(AnalysisPass):
 
     CONDITIONAL_SUPPORTED = (Gate, Delay)
 
-    def __init__(self, durations: InstructionDurations):
+    def __init__(self, durations: InstructionDurations, skip_conversion: bool = False):
         """Scheduler initializer.
 
         Args:
             durations: Durations of instructions to be used in scheduling
+            skip_conversion: Set ``True`` to not run :class:`.TimeUnitConversion` before
+                this pass. This avoids converting the circuit again when it has already
+                been converted, e.g. by a preceding scheduling pass with the same durations.
+                All op nodes must then have durations attached in a consistent unit.
         """
         super().__init__()
         self.durations = durations
 
         # Ensure op node durations are attached and in consistent unit
-        self.requires.append(TimeUnitConversion(durations))
+        if not skip_conversion:
+            self.requires.append(TimeUnitConversion(durations))
 
-        # Initialize timeslot
-        if "node_start_time" in self.property_set:
+        # Timeslot is populated by the run method of the subclass
+        if self.property_set.get("node_start_time") is not None:
             warnings.warn(
                 "This circuit has been already scheduled. "
                 "The output of previous scheduling pass will be overridden.",
                 UserWarning,
             )
-        self.property_set["node_start_time"] = dict()
 
     @staticmethod
     def _get_node_duration(
         node: DAGOpNode,
         bit_index_map: Dict,
         dag: DAGCircuit,
+        calibrations: Dict,
+        cal_cache: Dict,
     ) -> int:
-        """A helper method to get duration from node or calibration."""
-        indices = [bit_index_map[qarg] for qarg in node.qargs]
+        """A helper method to get duration from node or calibration.
 
-        if dag.has_calibration_for(node):
+        Args:
+            node: Op node to get the duration of.
+            bit_index_map: Mapping of qubit to its index in the DAG.
+            dag: DAG circuit the node belongs to.
+            calibrations: Calibrations of the DAG.
+            cal_cache: Durations of calibrated gates already resolved in the DAG,
+                keyed on (name, qubits, params). This is updated in place.
+
+        Returns:
+            Duration of the node.
+
+        Raises:
+            TranspilerError: if the duration is missing or parameterized.
+        """
+        op = node.op
+
+        # Ops without any calibration of the same name, e.g. delays, skip the qubit lookup
+        if op.name in calibrations and dag.has_calibration_for(node):
             # If node has calibration, this value should be the highest priority
-            cal_key = tuple(indices), tuple(float(p) for p in node.op.params)
-            duration = dag.calibrations[node.op.name][cal_key].duration
+            indices = tuple(BaseScheduler._qubit_indices(node, bit_index_map))
+            cal_key = op.name, indices, tuple(map(float, op.params))
+            if cal_key not in cal_cache:
+                cal_cache[cal_key] = calibrations[op.name][cal_key[1:]].duration
+            duration = cal_cache[cal_key]
 
             # Note that node duration is updated (but this is analysis pass)
-            node.op.duration = duration
+            op.duration = duration
         else:
-            duration = node.op.duration
+            duration = op.duration
 
-        if isinstance(duration, ParameterExpression):
-            raise TranspilerError(
-                f"Parameterized duration ({duration}) "
-                f"of {node.op.name} on qubits {indices} is not bounded."
-            )
+        if duration is None or isinstance(duration, ParameterExpression):
+            BaseScheduler._raise_invalid_duration(node, bit_index_map, duration)
+
+        return duration
+
+    @staticmethod
+    def _raise_invalid_duration(
+        node: DAGOpNode,
+        bit_index_map: Dict,
+        duration: Optional[ParameterExpression],
+    ):
+        """Raise an error for a node whose duration is missing or parameterized."""
+        indices = BaseScheduler._qubit_indices(node, bit_index_map)
         if duration is None:
             raise TranspilerError(f"Duration of {node.op.name} on qubits {indices} is not found.")
+        raise TranspilerError(
+            f"Parameterized duration ({duration}) "
+            f"of {node.op.name} on qubits {indices} is not bounded."
+        )
 
-        return duration
+    @staticmethod
+    def _qubit_indices(node: DAGOpNode, bit_index_map: Dict) -> List[int]:
+        """Return indices of the qubits the node acts on."""
+        return list(map(bit_index_map.__getitem__, node.qargs))
+
+    def _precompute_durations(
+        self,
+        dag: DAGCircuit,
+        nodes: Optional[Iterable[DAGOpNode]] = None,
+    ) -> Dict[DAGOpNode, int]:
+        """Resolve durations of all op nodes in the DAG in a single pass.
+
+        Args:
+            dag: DAG circuit to be scheduled.
+            nodes: Op nodes of the DAG, e.g. in the topological order the scheduler
+                already computed. All op nodes of the DAG are visited if not provided.
+
+        Returns:
+            Mapping of each op node to its duration.
+        """
+        if nodes is None:
+            nodes = dag.op_nodes()
+
+        bit_index_map = {bit: index for index, bit in enumerate(dag.qubits)}
+        calibrations = dag.calibrations
+        cal_cache = dict()
+        get_node_duration = self._get_node_duration
+
+        node_durations = dict()
+        for node in nodes:
+            duration = node.op.duration
+            if calibrations or not isinstance(duration, int):
+                # Calibrated, unbounded or missing durations need the full lookup
+                duration = get_node_duration(node, bit_index_map, dag, calibrations, cal_cache)
+            node_durations[node] = duration
+
+        return node_durations
 
     def run(self, dag: DAGCircuit):
         raise NotImplementedError
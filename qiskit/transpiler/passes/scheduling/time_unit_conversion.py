@@ -87,15 +87,26 @@ class TimeUnitConversion(TransformationPass):
 
         # Make units consistent
         bit_indices = {bit: index for index, bit in enumerate(dag.qubits)}
+        # Resolved durations keyed on (name, qubits), None if the duration is not defined.
+        # Delay is excluded because its duration comes from the instance.
+        resolved_durations = dict()
         for node in dag.op_nodes():
-            try:
-                node.op = node.op.copy()
-                node.op.duration = self.inst_durations.get(
-                    node.op, [bit_indices[qarg] for qarg in node.qargs], unit=time_unit
-                )
+            qubits = [bit_indices[qarg] for qarg in node.qargs]
+            key = None if isinstance(node.op, Delay) else (node.op.name, tuple(qubits))
+            if key in resolved_durations:
+                duration = resolved_durations[key]
+            else:
+                try:
+                    duration = self.inst_durations.get(node.op, qubits, unit=time_unit)
+                except TranspilerError:
+                    duration = None
+                if key is not None:
+                    resolved_durations[key] = duration
+            # Always copy so that nodes sharing an op instance can be updated independently
+            node.op = node.op.copy()
+            if duration is not None:
+                node.op.duration = duration
                 node.op.unit = time_unit
-            except TranspilerError:
-                pass
 
         self.property_set["time_unit"] = time_unit
         return dag
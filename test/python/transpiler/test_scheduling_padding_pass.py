@@ -13,9 +13,13 @@
 """Test the Scheduling/PadDelay passes"""
 
 import unittest
+from unittest.mock import patch
 
 from ddt import ddt, data, unpack
-from qiskit import QuantumCircuit
+from qiskit import QuantumCircuit, QuantumRegister
+from qiskit.circuit.library import XGate
+from qiskit.converters import circuit_to_dag
+from qiskit.dagcircuit import DAGCircuit
 from qiskit.pulse import Schedule, Play, Constant, DriveChannel
 from qiskit.test import QiskitTestCase
 from qiskit.transpiler.instruction_durations import InstructionDurations
@@ -24,6 +28,7 @@ from qiskit.transpiler.passes import (
     ALAPScheduleAnalysis,
     PadDelay,
     SetIOLatency,
+    TimeUnitConversion,
 )
 from qiskit.transpiler.passmanager import PassManager
 from qiskit.transpiler.exceptions import TranspilerError
@@ -819,6 +824,90 @@ class TestSchedulingAndPaddingPass(QiskitTestCase):
 
         self.assertEqual(scheduled, qc)
 
+    def test_scheduling_with_calibration_on_shared_op(self):
+        """Test calibrated duration does not leak to other nodes sharing the same op instance."""
+        qr = QuantumRegister(2, "q")
+        dag = DAGCircuit()
+        dag.add_qreg(qr)
+
+        x_gate = XGate()
+        x_gate.duration = 160
+        x_gate.unit = "dt"
+        dag.apply_operation_back(x_gate, [qr[0]], [])
+        dag.apply_operation_back(x_gate, [qr[1]], [])
+        dag.apply_operation_back(x_gate, [qr[1]], [])
+
+        x_sched = Schedule(Play(Constant(320, 0.1), DriveChannel(0)))
+        dag.add_calibration("x", [0], x_sched)
+
+        durations = InstructionDurations([("x", None, 160)])
+        dag = TimeUnitConversion(durations).run(dag)
+        scheduler = ASAPScheduleAnalysis(durations)
+        scheduler.run(dag)
+
+        bit_indices = {bit: index for index, bit in enumerate(dag.qubits)}
+        node_start_time = scheduler.property_set["node_start_time"]
+        scheduled = {
+            (bit_indices[node.qargs[0]], t0): node.op.duration
+            for node, t0 in node_start_time.items()
+        }
+        self.assertDictEqual(scheduled, {(0, 0): 320, (1, 0): 160, (1, 160): 160})
+
+    def test_skip_conversion_of_converted_circuit(self):
+        """Test time unit conversion is not repeated for a scheduler with skip_conversion."""
+        qc = QuantumCircuit(2)
+        qc.h(0)
+        qc.delay(500, 1)
+        qc.cx(0, 1)
+        qc.measure_all()
+
+        durations = InstructionDurations(
+            [("h", 0, 200), ("cx", [0, 1], 700), ("measure", None, 1000)]
+        )
+
+        with patch.object(
+            TimeUnitConversion, "run", autospec=True, side_effect=TimeUnitConversion.run
+        ) as conversion_run:
+            pm = PassManager([ASAPScheduleAnalysis(durations), ALAPScheduleAnalysis(durations)])
+            pm.run(qc)
+            self.assertEqual(conversion_run.call_count, 2)
+            expected = pm.property_set["node_start_time"]
+
+            conversion_run.reset_mock()
+            pm = PassManager(
+                [
+                    ASAPScheduleAnalysis(durations),
+                    ALAPScheduleAnalysis(durations, skip_conversion=True),
+                ]
+            )
+            pm.run(qc)
+            self.assertEqual(conversion_run.call_count, 1)
+
+        def _timeslots(node_start_time):
+            return sorted(
+                (node.name, tuple(qc.qubits.index(q) for q in node.qargs), t0)
+                for node, t0 in node_start_time.items()
+            )
+
+        self.assertEqual(_timeslots(pm.property_set["node_start_time"]), _timeslots(expected))
+
+    def test_scheduling_with_delay_calibration(self):
+        """Test calibrated duration of delay takes priority over its own duration."""
+        qc = QuantumCircuit(1)
+        qc.delay(100, 0)
+        qc.x(0)
+        qc.add_calibration("delay", [0], Schedule(Play(Constant(48, 0.0), DriveChannel(0))), [100])
+
+        durations = InstructionDurations([("x", None, 160)])
+        dag = TimeUnitConversion(durations).run(circuit_to_dag(qc))
+        scheduler = ASAPScheduleAnalysis(durations)
+        scheduler.run(dag)
+
+        node_start_time = scheduler.property_set["node_start_time"]
+        self.assertDictEqual(
+            {node.name: t0 for node, t0 in node_start_time.items()}, {"delay": 0, "x": 48}
+        )
+
 
 if __name__ == "__main__":
     unittest.main()